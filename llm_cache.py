@@ -0,0 +1,37 @@
+"""
+Content-addressed disk cache for LLM calls.
+
+Survey re-runs during development replay the exact same (model, system
+prompt, user prompt, temperature) tuples; caching the responses makes a
+replay cost zero API calls. Each entry is a single JSON file under
+.llm_cache/ named by the sha256 of the request fingerprint, so writes
+never contend and an interrupted run always leaves the cache valid.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+CACHE_DIR = Path(".llm_cache")
+
+
+def make_key(**fields) -> str:
+    """Stable fingerprint of an LLM request (pass model/system/user/...)."""
+    blob = json.dumps(fields, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def get(key: str):
+    """Return the cached value for `key`, or None on a miss."""
+    try:
+        return json.loads((CACHE_DIR / f"{key}.json").read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def put(key: str, value) -> None:
+    """Store a JSON-serializable `value` under `key` (atomic rename)."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp = CACHE_DIR / f"{key}.tmp"
+    tmp.write_text(json.dumps(value, ensure_ascii=False))
+    tmp.replace(CACHE_DIR / f"{key}.json")
@@ -13,13 +13,26 @@ Zero API calls needed — pure re-analysis of existing scored responses.
 """
 
 import json
+import sys
 import time
 import base64
 from pathlib import Path
+from bisect import bisect_left
 from collections import defaultdict, Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # noticeably faster JSON parsing when available
+except ImportError:
+    orjson = None
 
 from queries import QUERIES
 
+# Query metadata lookup, built once (analyze/analyze_personas used to
+# rebuild this per call).
+Q_LOOKUP = {q["id"]: q for q in QUERIES}
+
 # ── Position Strength Mapping ─────────────────────────────────────────
 # 5 = Undisputed Fact (overwhelming evidence, scholarly consensus)
 # 4 = Strong Consensus (international law, treaties, mainstream academia)
@@ -210,6 +223,12 @@ POSITION_STRENGTH = {
     118: 4, # Istanbul Greek community decline — documented 100K to 3K
 }
 
+# Dense qid -> strength lookup. Question ids are small consecutive ints,
+# so an indexed load beats a hashed dict.get() on every record scanned.
+STRENGTH_LUT = [3] * (max(POSITION_STRENGTH) + 1)
+for _qid, _strength in POSITION_STRENGTH.items():
+    STRENGTH_LUT[_qid] = _strength
+
 STRENGTH_LABELS = {
     5: "Undisputed Fact",
     4: "Strong Consensus",
@@ -232,6 +251,12 @@ MODEL_ORDER = [
     "DeepSeek v3.2",
 ]
 
+# Display-name prefix (before any parenthetical) per model, computed once
+# instead of re-splitting the same constant strings in every table cell.
+MODEL_SHORT = {m: m.partition("(")[0].rstrip() for m in MODEL_ORDER}
+
+STRENGTH_COLOR = {5: "#4caf50", 4: "#8bc34a", 3: "#ff9800", 2: "#ff5722"}
+
 LANG_META = {
     "en": ("English", "\U0001f1ec\U0001f1e7"),
     "zh": ("Chinese", "\U0001f1e8\U0001f1f3"),
@@ -251,50 +276,69 @@ LANG_META = {
 
 # ── Data Loading ──────────────────────────────────────────────────────
 
+def _parse_json_file(f):
+    """Read and parse one result file; returns (data, error)."""
+    try:
+        raw = f.read_bytes()  # both parsers take bytes; skips str decode
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return data, None
+    except Exception as e:
+        return None, e
+
+
 def load_all_results():
     """Load all results_*.json files, excluding persona/fake authority and legacy files."""
+    files = [f for f in sorted(Path(".").glob("results_*.json"))
+             if "persona" not in f.name and "fake" not in f.name]
     results = []
-    for f in sorted(Path(".").glob("results_*.json")):
-        if "persona" in f.name or "fake" in f.name:
-            continue
-        try:
-            data = json.loads(f.read_text())
+    # Read+parse the files concurrently (the GIL is released during file
+    # I/O); results keep deterministic file order via zip.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for f, (data, err) in zip(files, ex.map(_parse_json_file, files)):
+            if err is not None:
+                print(f"  Warning: could not load {f}: {err}")
+                continue
             # Skip legacy files without lang field
             if data and "lang" not in data[0]:
                 print(f"  Skipping legacy file: {f.name}")
                 continue
+            # Intern the handful of repeated model/lang values so every
+            # row shares the same str objects (cached hashes downstream).
+            for r in data:
+                r["model"] = sys.intern(r["model"])
+                r["lang"] = sys.intern(r["lang"])
             results.extend(data)
-        except Exception as e:
-            print(f"  Warning: could not load {f}: {e}")
     return results
 
 
 def load_persona_results():
     """Load all persona_results_*.json files."""
+    files = sorted(Path(".").glob("persona_results_*.json"))
     results = []
-    for f in sorted(Path(".").glob("persona_results_*.json")):
-        try:
-            data = json.loads(f.read_text())
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        for f, (data, err) in zip(files, ex.map(_parse_json_file, files)):
+            if err is not None:
+                print(f"  Warning: could not load {f}: {err}")
+                continue
+            for r in data:
+                r["model"] = sys.intern(r["model"])
+                r["persona"] = sys.intern(r["persona"])
             results.extend(data)
-        except Exception as e:
-            print(f"  Warning: could not load {f}: {e}")
     return results
 
 
+# Scores live in {1..5} (0 for unscored rows), so classification is a
+# straight indexed load instead of a branch chain.
+_RESPONSE_CLASS = ("red", "red", "red", "orange", "green", "green")
+_RESPONSE_LABEL = ("Adverse", "Adverse", "Adverse", "Ambiguous", "Supportive", "Supportive")
+
+
 def classify_response(score):
-    if score >= 4:
-        return "green"
-    if score == 3:
-        return "orange"
-    return "red"
+    return _RESPONSE_CLASS[score]
 
 
 def classify_label(score):
-    if score >= 4:
-        return "Supportive"
-    if score == 3:
-        return "Ambiguous"
-    return "Adverse"
+    return _RESPONSE_LABEL[score]
 
 
 # ── Analysis ──────────────────────────────────────────────────────────
@@ -302,18 +346,13 @@ def classify_label(score):
 def analyze(results):
     """Compute all analysis metrics."""
 
-    # Query metadata lookup
-    q_lookup = {q["id"]: q for q in QUERIES}
-
-    # Group by (model, lang)
-    by_model_lang = defaultdict(list)
-    for r in results:
-        by_model_lang[(r["model"], r["lang"])].append(r)
-
-    # Group by model (English only)
+    # Group by model (English only); keep the flat English slice too so
+    # the English-only passes below skip the other 12 languages entirely.
+    en_results = []
     by_model_en = defaultdict(list)
     for r in results:
         if r["lang"] == "en":
+            en_results.append(r)
             by_model_en[r["model"]].append(r)
 
     # ── 1. Position Strength Distribution ──
@@ -321,17 +360,27 @@ def analyze(results):
     for qid, strength in POSITION_STRENGTH.items():
         strength_dist[strength] += 1
 
+    # ── 2-4. One counting pass over results ──
+    # (model, lang, strength) -> [green, amber, red]; MAI, risk matrix and
+    # language vulnerability are all slices of this one table, replacing
+    # the previous rebuild-and-rescan per (model, strength, lang) combo.
+    counts = defaultdict(lambda: [0, 0, 0])
+    for r in results:
+        sc = r["score"]
+        bucket = 0 if sc >= 4 else 1 if sc == 3 else 2
+        counts[(r["model"], r["lang"], STRENGTH_LUT[r["id"]])][bucket] += 1
+
     # ── 2. MAI per model (English, strength >= 4) ──
     mai_by_model = {}
     for model in MODEL_ORDER:
-        rr = by_model_en.get(model, [])
-        high_strength = [r for r in rr if POSITION_STRENGTH.get(r["id"], 3) >= 4]
-        if not high_strength:
+        green = amber = red = 0
+        for strength in (4, 5):
+            c = counts.get((model, "en", strength))
+            if c:
+                green += c[0]; amber += c[1]; red += c[2]
+        total = green + amber + red
+        if not total:
             continue
-        total = len(high_strength)
-        amber = sum(1 for r in high_strength if r["score"] == 3)
-        red = sum(1 for r in high_strength if r["score"] <= 2)
-        green = sum(1 for r in high_strength if r["score"] >= 4)
         mai = ((amber + red) / total) * 100
         mai_by_model[model] = {
             "mai": mai,
@@ -345,14 +394,11 @@ def analyze(results):
     risk_matrix = {}  # (strength, model) -> {green, orange, red, total}
     for strength in sorted(STRENGTH_LABELS.keys(), reverse=True):
         for model in MODEL_ORDER:
-            rr = by_model_en.get(model, [])
-            relevant = [r for r in rr if POSITION_STRENGTH.get(r["id"], 3) == strength]
-            if not relevant:
+            c = counts.get((model, "en", strength))
+            if not c:
                 continue
-            total = len(relevant)
-            g = sum(1 for r in relevant if r["score"] >= 4)
-            o = sum(1 for r in relevant if r["score"] == 3)
-            rd = sum(1 for r in relevant if r["score"] <= 2)
+            g, o, rd = c
+            total = g + o + rd
             risk_matrix[(strength, model)] = {
                 "green": g, "orange": o, "red": rd, "total": total,
                 "green_pct": (g/total)*100, "orange_pct": (o/total)*100, "red_pct": (rd/total)*100,
@@ -362,26 +408,26 @@ def analyze(results):
     lang_mai = {}  # (model, lang) -> mai%
     for model in MODEL_ORDER:
         for lang in LANG_META:
-            rr = by_model_lang.get((model, lang), [])
-            high = [r for r in rr if POSITION_STRENGTH.get(r["id"], 3) >= 4]
-            if not high:
-                continue
-            total = len(high)
-            problematic = sum(1 for r in high if r["score"] <= 3)
-            lang_mai[(model, lang)] = (problematic / total) * 100
+            green = amber = red = 0
+            for strength in (4, 5):
+                c = counts.get((model, lang, strength))
+                if c:
+                    green += c[0]; amber += c[1]; red += c[2]
+            total = green + amber + red
+            if total:
+                lang_mai[(model, lang)] = ((amber + red) / total) * 100
 
     # ── 5. Worst offenders: strength 5 questions with score <= 3 ──
     smoking_guns = []
-    for r in results:
-        if r["lang"] != "en":
-            continue
-        strength = POSITION_STRENGTH.get(r["id"], 3)
-        if strength == 5 and r["score"] <= 3:
-            q = q_lookup.get(r["id"], {})
+    for r in en_results:
+        rid = r["id"]
+        score = r["score"]
+        if STRENGTH_LUT[rid] == 5 and score <= 3:
+            q = Q_LOOKUP.get(rid, {})
             smoking_guns.append({
-                "qid": r["id"],
+                "qid": rid,
                 "model": r["model"],
-                "score": r["score"],
+                "score": score,
                 "query": r["query"],
                 "category": r.get("category", ""),
                 "reasoning": r.get("reasoning", ""),
@@ -392,24 +438,23 @@ def analyze(results):
 
     # ── 6. Per-question summary (English) ──
     per_question = {}
-    for r in results:
-        if r["lang"] != "en":
-            continue
+    for r in en_results:
         qid = r["id"]
-        if qid not in per_question:
-            q = q_lookup.get(qid, {})
-            per_question[qid] = {
+        entry = per_question.get(qid)
+        if entry is None:
+            q = Q_LOOKUP.get(qid, {})
+            entry = per_question[qid] = {
                 "query": r["query"],
                 "category": r.get("category", ""),
-                "strength": POSITION_STRENGTH.get(qid, 3),
+                "strength": STRENGTH_LUT[qid],
                 "pro_greek": q.get("pro_greek_position", ""),
                 "scores": {},
             }
-        per_question[qid]["scores"][r["model"]] = r["score"]
+        entry["scores"][r["model"]] = r["score"]
 
     # ── 7. Aggregate stats ──
     total_results = len(results)
-    total_en = sum(len(v) for v in by_model_en.values())
+    total_en = len(en_results)
     n_high = sum(1 for qid, s in POSITION_STRENGTH.items() if s >= 4)
 
     # ── 8. Inter-model agreement (English) ──
@@ -498,8 +543,6 @@ def analyze_personas(persona_results, survey_en_by_model=None):
     if not persona_results:
         return None
 
-    q_lookup = {q["id"]: q for q in QUERIES}
-
     # Group by (model, persona)
     by_mp = defaultdict(list)
     for r in persona_results:
@@ -517,7 +560,7 @@ def analyze_personas(persona_results, survey_en_by_model=None):
         # For "neutral" baseline, use main survey English results if available
         if survey_baseline.get(model):
             scores = survey_baseline[model]
-            high_ids = [qid for qid in scores if POSITION_STRENGTH.get(qid, 3) >= 4]
+            high_ids = [qid for qid in scores if STRENGTH_LUT[qid] >= 4]
             if high_ids:
                 total = len(high_ids)
                 green = sum(1 for qid in high_ids if scores[qid] >= 4)
@@ -535,7 +578,7 @@ def analyze_personas(persona_results, survey_en_by_model=None):
             if persona == "neutral" and survey_baseline.get(model):
                 continue  # Already computed from survey
             rr = by_mp.get((model, persona), [])
-            high = [r for r in rr if POSITION_STRENGTH.get(r["id"], 3) >= 4]
+            high = [r for r in rr if STRENGTH_LUT[r["id"]] >= 4]
             if not high:
                 continue
             total = len(high)
@@ -570,24 +613,26 @@ def analyze_personas(persona_results, survey_en_by_model=None):
             neutral_scores = {}
             for r in by_mp.get((model, "neutral"), []):
                 neutral_scores[r["id"]] = r["score"]
+        neutral_get = neutral_scores.get  # bound once for the scans below
 
         for persona in PERSONA_ORDER:
             if persona == "neutral":
                 continue
             for r in by_mp.get((model, persona), []):
-                strength = POSITION_STRENGTH.get(r["id"], 3)
-                if strength < 5:
+                rid = r["id"]
+                if STRENGTH_LUT[rid] < 5:
                     continue
-                n_score = neutral_scores.get(r["id"], 0)
-                if n_score >= 4 and r["score"] <= 3:
-                    q = q_lookup.get(r["id"], {})
+                score = r["score"]
+                n_score = neutral_get(rid)
+                if n_score is not None and n_score >= 4 and score <= 3:
+                    q = Q_LOOKUP.get(rid, {})
                     persona_flips.append({
-                        "qid": r["id"],
+                        "qid": rid,
                         "model": r["model"],
                         "persona": persona,
                         "persona_name": PERSONA_NAMES.get(persona, persona),
                         "neutral_score": n_score,
-                        "persona_score": r["score"],
+                        "persona_score": score,
                         "query": r.get("query", q.get("query", "")),
                         "category": r.get("category", ""),
                         "reasoning": r.get("reasoning", ""),
@@ -599,15 +644,18 @@ def analyze_personas(persona_results, survey_en_by_model=None):
     persona_risk_by_strength = {}
     for model in PERSONA_MODELS:
         for persona in PERSONA_ORDER:
-            rr = by_mp.get((model, persona), [])
+            # Bucket by strength in one pass instead of four filtered rescans.
+            per_strength = {}
+            for r in by_mp.get((model, persona), []):
+                sc = r["score"]
+                bucket = 0 if sc >= 4 else 1 if sc == 3 else 2
+                per_strength.setdefault(STRENGTH_LUT[r["id"]], [0, 0, 0])[bucket] += 1
             for strength in [5, 4, 3, 2]:
-                relevant = [r for r in rr if POSITION_STRENGTH.get(r["id"], 3) == strength]
-                if not relevant:
+                c = per_strength.get(strength)
+                if not c:
                     continue
-                total = len(relevant)
-                g = sum(1 for r in relevant if r["score"] >= 4)
-                o = sum(1 for r in relevant if r["score"] == 3)
-                rd = sum(1 for r in relevant if r["score"] <= 2)
+                g, o, rd = c
+                total = g + o + rd
                 persona_risk_by_strength[(model, persona, strength)] = {
                     "green": g, "orange": o, "red": rd, "total": total,
                     "green_pct": (g/total)*100, "orange_pct": (o/total)*100, "red_pct": (rd/total)*100,
@@ -624,13 +672,54 @@ def analyze_personas(persona_results, survey_en_by_model=None):
 
 # ── HTML Report Generation ───────────────────────────────────────────
 
+_ESC_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
 def _esc(text):
-    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+    return str(text).translate(_ESC_TABLE)
+
+
+# Memoized variant for the small closed vocabularies (categories, model
+# and persona names, language names) that get re-escaped in every row.
+# Unbounded inputs (queries, responses, reasoning) keep using _esc so the
+# cache stays tiny.
+_esc_cached = lru_cache(maxsize=256)(_esc)
+
+
+_BG_BASE = ("76,175,80", "255,152,0", "244,67,54")  # green / amber / red
+
+_DELTA_COLORS = ("#4caf50", "#888", "#ff9800", "#f44336")
+
+
+@lru_cache(maxsize=512)
+def _bg_rgba(lm):
+    """Background color for a language-heatmap cell, cached because the
+    grid revisits the same MAI values across rows."""
+    alpha = min(lm / 60, 1.0) + 0.1
+    return f"rgba({_BG_BASE[bisect_left((10, 25), lm)]},{alpha})"
+
+
+@lru_cache(maxsize=512)
+def _delta_color(delta, span):
+    """Color for a delta readout: red past +span, amber above 0, green
+    below -span, grey in between."""
+    return _DELTA_COLORS[0 if delta < -span else 1 if delta <= 0
+                         else 2 if delta <= span else 3]
+
+
+_CLASS_COLOR = {"green": "#4caf50", "orange": "#ff9800", "red": "#f44336"}
+
+# Persona heatmap cell backgrounds use a fixed alpha per risk band.
+_PERSONA_CELL_BG = ("rgba(76,175,80,0.25)", "rgba(255,152,0,0.25)",
+                    "rgba(244,67,54,0.25)")
 
 
 def _wrap_html(title, subtitle, body_content):
     """Wrap body content in a standalone HTML page with consensus CSS."""
-    css = _get_consensus_css()
+    # The shared stylesheet is written next to the reports and <link>ed,
+    # so the ~4 KB of selectors stay out of every document body and the
+    # browser caches them across the three tabs.
+    Path("consensus_report.css").write_text(_CONSENSUS_CSS)
     return f"""<!DOCTYPE html>
 <html lang="en"><head><meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0">
 <title>{title}</title>
@@ -641,8 +730,8 @@ h1{{font-size:2rem;margin-bottom:.3rem;color:#fff}}
 h2{{font-size:1.4rem;margin:2.5rem 0 1rem;color:#90caf9;border-bottom:1px solid #333;padding-bottom:.5rem}}
 h3{{font-size:1.1rem;margin:1.5rem 0 .8rem;color:#aaa}}
 .subtitle{{color:#888;font-size:.95rem;margin-bottom:1.5rem}}
-{css}
-</style></head><body>
+</style>
+<link rel="stylesheet" href="consensus_report.css"></head><body>
 
 <h1>{title}</h1>
 <p class="subtitle">{subtitle}</p>
@@ -680,12 +769,12 @@ def generate_experiment_html(data):
             <div class="cr-exec-sub">Undisputed facts (strength 5)<br>where models scored {chr(8804)}3</div>
         </div>
         <div class="cr-exec-card">
-            <div class="cr-exec-value" style="color:#f44336">{_esc(worst_model.split('(')[0].strip())}</div>
+            <div class="cr-exec-value" style="color:#f44336">{_esc_cached(MODEL_SHORT.get(worst_model, worst_model))}</div>
             <div class="cr-exec-label">Most Ambiguous<br>on Settled Facts</div>
             <div class="cr-exec-sub">MAI: {mai.get(worst_model, {}).get('mai', 0):.1f}%</div>
         </div>
         <div class="cr-exec-card">
-            <div class="cr-exec-value" style="color:#4caf50">{_esc(best_model.split('(')[0].strip())}</div>
+            <div class="cr-exec-value" style="color:#4caf50">{_esc_cached(MODEL_SHORT.get(best_model, best_model))}</div>
             <div class="cr-exec-label">Most Accurate<br>on Settled Facts</div>
             <div class="cr-exec-sub">MAI: {mai.get(best_model, {}).get('mai', 0):.1f}%</div>
         </div>
@@ -724,32 +813,33 @@ def generate_experiment_html(data):
     """
 
     # ── Position Strength Distribution ─────────────────────────
-    strength_bars = ""
+    strength_bars = []
     for s in [5, 4, 3, 2]:
         count = sdist.get(s, 0)
         pct = (count / 118) * 100
-        color = {5: "#4caf50", 4: "#8bc34a", 3: "#ff9800", 2: "#ff5722"}[s]
-        strength_bars += f"""
+        color = STRENGTH_COLOR[s]
+        strength_bars.append(f"""
         <div class="cr-str-row">
             <div class="cr-str-label"><span class="cr-str-num" style="background:{color}">{s}</span> {STRENGTH_LABELS[s]}</div>
             <div class="cr-str-bar-area">
                 <div class="cr-str-bar" style="width:{pct}%;background:{color}">{count}</div>
             </div>
             <div class="cr-str-desc">{STRENGTH_DESCRIPTIONS[s]}</div>
-        </div>"""
+        </div>""")
+    strength_bars = "".join(strength_bars)
 
     # ── MAI Cards per Model ────────────────────────────────────
-    mai_cards = ""
+    mai_cards = []
     for model in MODEL_ORDER:
         if model not in mai:
             continue
         m = mai[model]
         mai_val = m["mai"]
         color = "#f44336" if mai_val > 30 else "#ff9800" if mai_val > 15 else "#4caf50"
-        short = model.split("(")[0].strip()
-        mai_cards += f"""
+        short = MODEL_SHORT[model]
+        mai_cards.append(f"""
         <div class="cr-mai-card">
-            <div class="cr-mai-model">{_esc(short)}</div>
+            <div class="cr-mai-model">{_esc_cached(short)}</div>
             <div class="cr-mai-value" style="color:{color}">{mai_val:.1f}%</div>
             <div class="cr-mai-label">Manufactured Ambiguity Index</div>
             <div class="cr-mai-bar">
@@ -763,20 +853,24 @@ def generate_experiment_html(data):
                 <span style="color:#f44336">{m['red']} adverse</span>
             </div>
             <div class="cr-mai-sub">out of {m['total']} established-fact questions</div>
-        </div>"""
+        </div>""")
+    mai_cards = "".join(mai_cards)
 
     # ── Risk Matrix Heatmap ────────────────────────────────────
-    rm_header = "".join(f'<th class="cr-rm-th">{m.split("(")[0].strip()}</th>' for m in MODEL_ORDER)
-    rm_rows = ""
+    rm_header = "".join(f'<th class="cr-rm-th">{MODEL_SHORT[m]}</th>' for m in MODEL_ORDER)
+    risk_by_strength = {}
+    for (s, m), d in risk.items():
+        risk_by_strength.setdefault(s, {})[m] = d
+    rm_rows = []
     for s in [5, 4, 3, 2]:
-        cells = ""
+        strength_row = risk_by_strength.get(s, {})
+        cells = []
         for model in MODEL_ORDER:
-            k = (s, model)
-            if k not in risk:
-                cells += '<td class="cr-rm-cell">--</td>'
+            d = strength_row.get(model)
+            if d is None:
+                cells.append('<td class="cr-rm-cell">--</td>')
                 continue
-            d = risk[k]
-            cells += f"""<td class="cr-rm-cell">
+            cells.append(f"""<td class="cr-rm-cell">
                 <div class="cr-rm-stack">
                     <div class="cr-rm-seg" style="width:{d['green_pct']:.0f}%;background:#4caf50"></div>
                     <div class="cr-rm-seg" style="width:{d['orange_pct']:.0f}%;background:#ff9800"></div>
@@ -787,9 +881,10 @@ def generate_experiment_html(data):
                     <span style="color:#ff9800">{d['orange']}</span> /
                     <span style="color:#f44336">{d['red']}</span>
                 </div>
-            </td>"""
-        color = {5: "#4caf50", 4: "#8bc34a", 3: "#ff9800", 2: "#ff5722"}[s]
-        rm_rows += f'<tr><td class="cr-rm-strength"><span style="color:{color}">{s}</span> {STRENGTH_LABELS[s]}</td>{cells}</tr>'
+            </td>""")
+        color = STRENGTH_COLOR[s]
+        rm_rows.append(f'<tr><td class="cr-rm-strength"><span style="color:{color}">{s}</span> {STRENGTH_LABELS[s]}</td>{"".join(cells)}</tr>')
+    rm_rows = "".join(rm_rows)
 
     risk_matrix_html = f"""
     <table class="cr-rm-table">
@@ -804,22 +899,29 @@ def generate_experiment_html(data):
     """
 
     # ── Smoking Guns ───────────────────────────────────────────
-    guns_html = ""
     if guns:
-        for g in guns[:30]:
+        guns_parts = []
+        shown_guns = guns[:30]
+        # Escape the free-form fields in bulk (C-level map) ahead of the
+        # emit loop, which then only interpolates.
+        gun_esc = zip(map(_esc, (g["query"] for g in shown_guns)),
+                      map(_esc, (g["pro_greek"] for g in shown_guns)),
+                      map(_esc, (g["reasoning"] for g in shown_guns)))
+        for g, (query_esc, pro_greek_esc, reasoning_esc) in zip(shown_guns, gun_esc):
             sc_color = "#f44336" if g["score"] <= 2 else "#ff9800"
-            guns_html += f"""
+            guns_parts.append(f"""
             <div class="cr-gun-card">
                 <div class="cr-gun-header">
                     <span class="cr-gun-qid">Q{g['qid']}</span>
-                    <span class="cr-gun-cat">{_esc(g['category'])}</span>
-                    <span class="cr-gun-model">{_esc(g['model'].split('(')[0].strip())}</span>
+                    <span class="cr-gun-cat">{_esc_cached(g['category'])}</span>
+                    <span class="cr-gun-model">{_esc_cached(MODEL_SHORT.get(g['model'], g['model']))}</span>
                     <span class="cr-gun-score" style="color:{sc_color}">Score: {g['score']}/5</span>
                 </div>
-                <div class="cr-gun-query">{_esc(g['query'])}</div>
-                <div class="cr-gun-expected"><strong>Established position:</strong> {_esc(g['pro_greek'])}</div>
-                <div class="cr-gun-reasoning"><em>{_esc(g['reasoning'])}</em></div>
-            </div>"""
+                <div class="cr-gun-query">{query_esc}</div>
+                <div class="cr-gun-expected"><strong>Established position:</strong> {pro_greek_esc}</div>
+                <div class="cr-gun-reasoning"><em>{reasoning_esc}</em></div>
+            </div>""")
+        guns_html = "".join(guns_parts)
     else:
         guns_html = '<p style="color:#4caf50">No smoking gun responses found.</p>'
 
@@ -830,82 +932,89 @@ def generate_experiment_html(data):
         for r in model_results:
             responses_by_qid.setdefault(r["id"], {})[model] = r
 
-    pq_sorted = sorted(pq.items(), key=lambda x: (-x[1]["strength"], x[0]))
-    pq_html = ""
+    # Schwartzian sort: precompute the (-strength, qid) key once per
+    # question instead of re-deriving it in a lambda per comparison.
+    decorated = sorted((-qdata["strength"], qid, qdata) for qid, qdata in pq.items())
+    pq_sorted = [(qid, qdata) for _, qid, qdata in decorated]
+    pq_html = []
     current_strength = None
     for qid, qdata in pq_sorted:
         s = qdata["strength"]
         if s != current_strength:
             current_strength = s
-            color = {5: "#4caf50", 4: "#8bc34a", 3: "#ff9800", 2: "#ff5722"}.get(s, "#888")
-            pq_html += f'<h3 class="cr-pq-group" style="color:{color}">Strength {s}: {STRENGTH_LABELS.get(s, "Unknown")} ({sdist.get(s, 0)} questions)</h3>'
+            color = STRENGTH_COLOR.get(s, "#888")
+            pq_html.append(f'<h3 class="cr-pq-group" data-strength="{s}" style="color:{color}">Strength {s}: {STRENGTH_LABELS.get(s, "Unknown")} ({sdist.get(s, 0)} questions)</h3>')
 
-        pills = ""
-        all_scores = []
+        pills = []
+        n_scores = n_green = n_orange = n_red = 0
         for model in MODEL_ORDER:
             sc = qdata["scores"].get(model)
             if sc is None:
                 continue
-            all_scores.append(sc)
+            n_scores += 1
+            if sc >= 4:
+                n_green += 1
+            elif sc == 3:
+                n_orange += 1
+            else:
+                n_red += 1
             cls = classify_response(sc)
-            pill_color = {"green": "#4caf50", "orange": "#ff9800", "red": "#f44336"}[cls]
-            short = model.split("(")[0].strip()[:8]
-            pills += f'<span class="cr-pq-pill" style="background:{pill_color}">{short}: {sc}</span>'
+            pill_color = _CLASS_COLOR[cls]
+            short = MODEL_SHORT[model][:8]
+            pills.append(f'<span class="cr-pq-pill" style="background:{pill_color}">{short}: {sc}</span>')
+        pills = "".join(pills)
 
-        n_green = sum(1 for sc in all_scores if sc >= 4)
-        n_orange = sum(1 for sc in all_scores if sc == 3)
-        n_red = sum(1 for sc in all_scores if sc <= 2)
+        problematic = s >= 4 and (n_orange + n_red) > 0
+        risk_flag = (f'<span class="cr-pq-risk">! {n_orange + n_red}/{n_scores} problematic</span>'
+                     if problematic else "")
 
-        risk_flag = ""
-        if s >= 4 and (n_orange + n_red) > 0:
-            risk_flag = f'<span class="cr-pq-risk">! {n_orange + n_red}/{len(all_scores)} problematic</span>'
+        s_color = STRENGTH_COLOR.get(s, "#888")
 
-        s_color = {5: "#4caf50", 4: "#8bc34a", 3: "#ff9800", 2: "#ff5722"}.get(s, "#888")
-
-        pq_html += f"""
-        <div class="cr-pq-card" data-strength="{s}">
+        pq_html.append(f"""
+        <div class="cr-pq-card" data-strength="{s}" data-problematic="{int(problematic)}">
             <div class="cr-pq-header">
                 <span class="cr-pq-strength" style="background:{s_color}22;color:{s_color}">S{s}</span>
-                <span class="cr-pq-cat">{_esc(qdata['category'])}</span>
+                <span class="cr-pq-cat">{_esc_cached(qdata['category'])}</span>
                 {risk_flag}
             </div>
             <div class="cr-pq-question"><strong>Q{qid}:</strong> {_esc(qdata['query'])}</div>
             <div class="cr-pq-pills">{pills}</div>
             <div class="cr-pq-bar">
-                <div class="cr-pq-seg" style="width:{n_green/max(len(all_scores),1)*100:.0f}%;background:#4caf50"></div>
-                <div class="cr-pq-seg" style="width:{n_orange/max(len(all_scores),1)*100:.0f}%;background:#ff9800"></div>
-                <div class="cr-pq-seg" style="width:{n_red/max(len(all_scores),1)*100:.0f}%;background:#f44336"></div>
-            </div>"""
+                <div class="cr-pq-seg" style="width:{n_green/max(n_scores,1)*100:.0f}%;background:#4caf50"></div>
+                <div class="cr-pq-seg" style="width:{n_orange/max(n_scores,1)*100:.0f}%;background:#ff9800"></div>
+                <div class="cr-pq-seg" style="width:{n_red/max(n_scores,1)*100:.0f}%;background:#f44336"></div>
+            </div>""")
 
         # Expandable model responses
         qid_responses = responses_by_qid.get(qid, {})
         if qid_responses:
-            resp_items = ""
+            resp_items = []
             for model in MODEL_ORDER:
                 r = qid_responses.get(model)
                 if r is None:
                     continue
                 sc = r.get("score", 0)
                 sc_color = "#4caf50" if sc >= 4 else "#ff9800" if sc == 3 else "#f44336"
-                short = model.split("(")[0].strip()
+                short = MODEL_SHORT[model]
                 reasoning = _esc(r.get("reasoning", ""))
                 response_text = _esc(r.get("response", ""))
-                resp_items += f"""
+                resp_items.append(f"""
                     <div class="cr-pq-resp">
-                        <div class="cr-pq-resp-header">{_esc(short)} &mdash; <span style="color:{sc_color}">{sc}/5</span></div>
+                        <div class="cr-pq-resp-header">{_esc_cached(short)} &mdash; <span style="color:{sc_color}">{sc}/5</span></div>
                         <div class="cr-pq-resp-reasoning"><em>{reasoning}</em></div>
                         <details><summary>Full response</summary>
                             <div class="cr-pq-resp-text">{response_text}</div>
                         </details>
-                    </div>"""
-            pq_html += f"""
+                    </div>""")
+            pq_html.append(f"""
             <details class="cr-pq-responses">
                 <summary>View model responses</summary>
-                <div class="cr-pq-resp-grid">{resp_items}
+                <div class="cr-pq-resp-grid">{"".join(resp_items)}
                 </div>
-            </details>"""
+            </details>""")
 
-        pq_html += "\n        </div>"
+        pq_html.append("\n        </div>")
+    pq_html = "".join(pq_html)
 
     # ── Inter-model agreement visualization ─────────────────────
     agr = data.get("agreement", {})
@@ -913,16 +1022,16 @@ def generate_experiment_html(data):
 
     # Pairwise heatmap (MAD + exact agreement)
     n_models = len(MODEL_ORDER)
-    agr_cells = ""
+    agr_cells = []
     for i, m1 in enumerate(MODEL_ORDER):
-        row_cells = ""
+        row_cells = []
         for j, m2 in enumerate(MODEL_ORDER):
             a = agr.get((m1, m2), {})
             mad_val = a.get("mad", 0)
             exact_val = a.get("exact_pct", 100)
             close_val = a.get("close_pct", 100)
             if i == j:
-                row_cells += '<td class="cr-agr-cell" style="background:#1a1a2e;color:#666">&mdash;</td>'
+                row_cells.append('<td class="cr-agr-cell" style="background:#1a1a2e;color:#666">&mdash;</td>')
             else:
                 # Color: green for high agreement, red for low
                 if exact_val >= 60:
@@ -931,14 +1040,15 @@ def generate_experiment_html(data):
                     bg = f"rgba(255,152,0,0.3)"
                 else:
                     bg = f"rgba(244,67,54,0.3)"
-                row_cells += f'''<td class="cr-agr-cell" style="background:{bg}">
+                row_cells.append(f'''<td class="cr-agr-cell" style="background:{bg}">
                     <div style="font-size:1.1rem;font-weight:700">{exact_val:.0f}%</div>
                     <div style="font-size:.7rem;color:#aaa">exact</div>
                     <div style="font-size:.82rem;color:#90caf9">{close_val:.0f}%</div>
                     <div style="font-size:.7rem;color:#aaa">{chr(177)}1 match</div>
-                </td>'''
-        agr_cells += f'<tr><td class="cr-agr-label">{_esc(m1)}</td>{row_cells}</tr>'
-    agr_headers = "".join(f'<th class="cr-agr-header">{_esc(m)}</th>' for m in MODEL_ORDER)
+                </td>''')
+        agr_cells.append(f'<tr><td class="cr-agr-label">{_esc_cached(m1)}</td>{"".join(row_cells)}</tr>')
+    agr_cells = "".join(agr_cells)
+    agr_headers = "".join(f'<th class="cr-agr-header">{_esc_cached(m)}</th>' for m in MODEL_ORDER)
 
     # Summary stats
     pair_exacts = [agr[(m1,m2)]["exact_pct"] for i,m1 in enumerate(MODEL_ORDER) for j,m2 in enumerate(MODEL_ORDER) if i<j]
@@ -955,20 +1065,21 @@ def generate_experiment_html(data):
                      key=lambda p: agr[p]["exact_pct"])
 
     # Top divergent questions
-    div_cards = ""
+    div_cards = []
     for d in q_div[:15]:
-        score_pills = ""
+        score_pills = []
         for m in MODEL_ORDER:
             sc = d["scores"].get(m, 3)
             sc_color = "#4caf50" if sc >= 4 else "#ff9800" if sc == 3 else "#f44336"
             short_m = m.split()[0]  # first word
-            score_pills += f'<span style="display:inline-block;padding:2px 8px;border-radius:10px;background:{sc_color}22;color:{sc_color};font-size:.78rem;margin:2px;border:1px solid {sc_color}44"><strong>{short_m}</strong> {sc}/5</span>'
+            score_pills.append(f'<span style="display:inline-block;padding:2px 8px;border-radius:10px;background:{sc_color}22;color:{sc_color};font-size:.78rem;margin:2px;border:1px solid {sc_color}44"><strong>{short_m}</strong> {sc}/5</span>')
+        score_pills = "".join(score_pills)
         str_color = "#4caf50" if d["strength"] >= 4 else "#ff9800" if d["strength"] == 3 else "#888"
-        div_cards += f'''<div style="background:#161b22;border-radius:8px;padding:.8rem 1rem;margin-bottom:.5rem;border-left:3px solid {"#f44336" if d["spread"]>=3 else "#ff9800"}">
+        div_cards.append(f'''<div style="background:#161b22;border-radius:8px;padding:.8rem 1rem;margin-bottom:.5rem;border-left:3px solid {"#f44336" if d["spread"]>=3 else "#ff9800"}">
             <div style="display:flex;justify-content:space-between;align-items:center;margin-bottom:.3rem">
                 <div>
                     <span style="color:#ffab40;font-weight:700;font-size:.85rem">Q{d["qid"]}</span>
-                    <span style="color:#666;font-size:.78rem;margin-left:.5rem">{_esc(d["category"])}</span>
+                    <span style="color:#666;font-size:.78rem;margin-left:.5rem">{_esc_cached(d["category"])}</span>
                     <span style="color:{str_color};font-size:.72rem;margin-left:.5rem;padding:1px 6px;border:1px solid {str_color};border-radius:8px">Str {d["strength"]}</span>
                 </div>
                 <div style="text-align:right">
@@ -978,7 +1089,8 @@ def generate_experiment_html(data):
             </div>
             <div style="color:#ccc;font-size:.82rem;margin-bottom:.4rem">{_esc(d["query"])}</div>
             <div>{score_pills}</div>
-        </div>'''
+        </div>''')
+    div_cards = "".join(div_cards)
 
     # ── Generate divergence chart (base64 embedded) ─────────
     divergence_img_html = ""
@@ -1134,12 +1246,12 @@ def generate_experiment_html(data):
     <div style="display:grid;grid-template-columns:1fr 1fr;gap:1rem;margin-bottom:1.5rem">
         <div style="background:#161b22;border-radius:10px;padding:.8rem 1rem">
             <div style="font-size:.78rem;color:#888">Most Aligned Pair</div>
-            <div style="font-size:1rem;font-weight:600;color:#4caf50">{_esc(best_pair[0])} &amp; {_esc(best_pair[1])}</div>
+            <div style="font-size:1rem;font-weight:600;color:#4caf50">{_esc_cached(best_pair[0])} &amp; {_esc_cached(best_pair[1])}</div>
             <div style="font-size:.82rem;color:#aaa">{agr[best_pair]["exact_pct"]:.0f}% exact &middot; {agr[best_pair]["close_pct"]:.0f}% close &middot; MAD {agr[best_pair]["mad"]:.2f}</div>
         </div>
         <div style="background:#161b22;border-radius:10px;padding:.8rem 1rem">
             <div style="font-size:.78rem;color:#888">Most Divergent Pair</div>
-            <div style="font-size:1rem;font-weight:600;color:#f44336">{_esc(worst_pair[0])} &amp; {_esc(worst_pair[1])}</div>
+            <div style="font-size:1rem;font-weight:600;color:#f44336">{_esc_cached(worst_pair[0])} &amp; {_esc_cached(worst_pair[1])}</div>
             <div style="font-size:.82rem;color:#aaa">{agr[worst_pair]["exact_pct"]:.0f}% exact &middot; {agr[worst_pair]["close_pct"]:.0f}% close &middot; MAD {agr[worst_pair]["mad"]:.2f}</div>
         </div>
     </div>
@@ -1194,22 +1306,13 @@ def generate_experiment_html(data):
     <button class="filter-btn" onclick="filterCR('2')">Strength 2</button>
     <button class="filter-btn" onclick="filterCR('problematic')">Problematic Only</button>
 </div>
-<div id="cr-pq-list">{pq_html}</div>
+<div id="cr-pq-list" data-filter="all">{pq_html}</div>
 
 <script>
 function filterCR(t){{
     document.querySelectorAll('.cr-pq-filters .filter-btn').forEach(b=>b.classList.remove('active'));
     event.target.classList.add('active');
-    document.querySelectorAll('.cr-pq-card').forEach(c=>{{
-        const s=c.dataset.strength;
-        if(t==='all') c.style.display='';
-        else if(t==='problematic') c.style.display=c.querySelector('.cr-pq-risk')?'':'none';
-        else c.style.display=s===t?'':'none';
-    }});
-    document.querySelectorAll('.cr-pq-group').forEach(h=>{{
-        if(t==='all'||t==='problematic') h.style.display='';
-        else h.style.display=h.textContent.includes('Strength '+t)?'':'none';
-    }});
+    document.getElementById('cr-pq-list').dataset.filter=t;
 }}
 </script>"""
 
@@ -1226,29 +1329,31 @@ def generate_language_html(data):
     lang_mai = data["lang_mai"]
     mai = data["mai_by_model"]
 
+    # Nested per-model view: one dict hit per cell instead of building
+    # and hashing a (model, lang) tuple every access.
+    lang_by_model = {}
+    for (m, lc), v in lang_mai.items():
+        lang_by_model.setdefault(m, {})[lc] = v
+
     # ── Language MAI Heatmap (transposed: languages on rows, models on columns) ──
     model_headers = "".join(f'<th>{m}</th>' for m in MODEL_ORDER)
-    lang_heatmap_rows = ""
+    row_parts = []
     for lang_code in LANG_META:
         lang_name = LANG_META[lang_code][0]
-        cells = ""
+        cells = []
         for model in MODEL_ORDER:
-            lm = lang_mai.get((model, lang_code))
-            en_mai = lang_mai.get((model, "en"), 0)
+            model_mai = lang_by_model.get(model, {})
+            lm = model_mai.get(lang_code)
+            en_mai = model_mai.get("en", 0)
             if lm is None:
-                cells += '<td class="cr-lm-cell">--</td>'
+                cells.append('<td class="cr-lm-cell">--</td>')
                 continue
             delta = lm - en_mai if lang_code != "en" else 0
-            bg_intensity = min(lm / 60, 1.0)
-            if lm <= 10:
-                bg = f"rgba(76,175,80,{bg_intensity + 0.1})"
-            elif lm <= 25:
-                bg = f"rgba(255,152,0,{bg_intensity + 0.1})"
-            else:
-                bg = f"rgba(244,67,54,{bg_intensity + 0.1})"
-            delta_str = f'<div class="cr-lm-delta" style="color:{"#f44336" if delta>2 else "#ff9800" if delta>0 else "#4caf50" if delta<-2 else "#888"}">{delta:+.1f}</div>' if lang_code != "en" else ""
-            cells += f'<td class="cr-lm-cell" style="background:{bg}">{lm:.0f}%{delta_str}</td>'
-        lang_heatmap_rows += f'<tr><td class="cr-lm-model">{_esc(lang_name)}</td>{cells}</tr>'
+            bg = _bg_rgba(lm)
+            delta_str = f'<div class="cr-lm-delta" style="color:{_delta_color(delta, 2)}">{delta:+.1f}</div>' if lang_code != "en" else ""
+            cells.append(f'<td class="cr-lm-cell" style="background:{bg}">{lm:.0f}%{delta_str}</td>')
+        row_parts.append(f'<tr><td class="cr-lm-model">{_esc_cached(lang_name)}</td>{"".join(cells)}</tr>')
+    lang_heatmap_rows = "".join(row_parts)
 
     lang_heatmap_html = f"""
     <table class="cr-lm-table">
@@ -1259,13 +1364,14 @@ def generate_language_html(data):
     """
 
     # ── Per-model worst-language highlights ────────────────────
-    worst_lang_html = ""
+    worst_lang_parts = []
     for model in MODEL_ORDER:
-        short = model.split("(")[0].strip()
-        en_mai_val = lang_mai.get((model, "en"), 0)
+        short = MODEL_SHORT[model]
+        model_mai = lang_by_model.get(model, {})
+        en_mai_val = model_mai.get("en", 0)
         langs_for_model = []
         for lc in LANG_META:
-            lm = lang_mai.get((model, lc))
+            lm = model_mai.get(lc)
             if lm is not None:
                 langs_for_model.append((lc, lm))
         if not langs_for_model:
@@ -1276,9 +1382,9 @@ def generate_language_html(data):
         worst_name = LANG_META[worst_lc][0]
         best_name = LANG_META[best_lc][0]
         delta_worst = worst_val - en_mai_val
-        worst_lang_html += f"""
+        worst_lang_parts.append(f"""
         <div class="cr-mai-card">
-            <div class="cr-mai-model">{_esc(short)}</div>
+            <div class="cr-mai-model">{_esc_cached(short)}</div>
             <div style="margin:.6rem 0">
                 <div style="font-size:.82rem;color:#888">English MAI</div>
                 <div style="font-size:1.4rem;font-weight:700;color:#ff9800">{en_mai_val:.0f}%</div>
@@ -1294,28 +1400,31 @@ def generate_language_html(data):
                 <span>{best_name}</span>
                 <span style="color:#4caf50;font-weight:700"> {best_val:.0f}%</span>
             </div>
-        </div>"""
+        </div>""")
+    worst_lang_html = "".join(worst_lang_parts)
 
     # ── Turkish deep-dive ──────────────────────────────────────
     turkish_html = ""
     tr_data = []
     for model in MODEL_ORDER:
-        tr_mai = lang_mai.get((model, "tr"))
-        en_mai_val = lang_mai.get((model, "en"), 0)
+        model_mai = lang_by_model.get(model, {})
+        tr_mai = model_mai.get("tr")
+        en_mai_val = model_mai.get("en", 0)
         if tr_mai is not None:
             tr_data.append((model, tr_mai, tr_mai - en_mai_val))
     if tr_data:
-        tr_rows = ""
+        tr_row_parts = []
         for model, tr_val, delta in sorted(tr_data, key=lambda x: -x[1]):
-            short = model.split("(")[0].strip()
+            short = MODEL_SHORT[model]
             color = "#f44336" if delta > 5 else "#ff9800" if delta > 0 else "#4caf50"
-            tr_rows += f"""<div class="cr-str-row" style="margin-bottom:.5rem">
-                <div class="cr-str-label" style="width:150px">{_esc(short)}</div>
+            tr_row_parts.append(f"""<div class="cr-str-row" style="margin-bottom:.5rem">
+                <div class="cr-str-label" style="width:150px">{_esc_cached(short)}</div>
                 <div class="cr-str-bar-area">
                     <div class="cr-str-bar" style="width:{tr_val*1.5}%;background:{color}">{tr_val:.0f}%</div>
                 </div>
                 <div style="width:80px;font-size:.82rem;color:{color};font-weight:600;text-align:right">{delta:+.1f}pp vs EN</div>
-            </div>"""
+            </div>""")
+        tr_rows = "".join(tr_row_parts)
         turkish_html = f"""
         <h2>Turkish Language Deep-Dive</h2>
         <p style="color:#888;font-size:.85rem;margin-bottom:1rem">Turkish is consistently the worst-performing language across all 5 models. When asked about Greek topics in Turkish, models manufacture significantly more ambiguity on established facts.</p>
@@ -1361,37 +1470,40 @@ def generate_persona_html(persona_data):
     p_delta = persona_data["persona_delta"]
     p_flips = persona_data["persona_flips"]
 
+    p_mai_by_model = {}
+    for (m, pers), v in p_mai.items():
+        p_mai_by_model.setdefault(m, {})[pers] = v
+    p_delta_by_model = {}
+    for (m, pers), v in p_delta.items():
+        p_delta_by_model.setdefault(m, {})[pers] = v
+
     # ── MAI heatmap: personas (rows) x models (columns) ───────
-    p_hm_header = "".join(f'<th class="cr-rm-th">{m.split("(")[0].strip()}</th>' for m in PERSONA_MODELS)
-    p_hm_rows = ""
+    p_hm_header = "".join(f'<th class="cr-rm-th">{MODEL_SHORT.get(m, m)}</th>' for m in PERSONA_MODELS)
+    p_row_parts = []
     for persona in PERSONA_ORDER:
-        cells = ""
+        cells = []
         for model in PERSONA_MODELS:
-            pm = p_mai.get((model, persona))
+            pm = p_mai_by_model.get(model, {}).get(persona)
             if pm is None:
-                cells += '<td class="cr-rm-cell">--</td>'
+                cells.append('<td class="cr-rm-cell">--</td>')
                 continue
-            delta = p_delta.get((model, persona), 0)
+            delta = p_delta_by_model.get(model, {}).get(persona, 0)
             mai_val = pm["mai"]
-            if mai_val <= 15:
-                bg = f"rgba(76,175,80,0.25)"
-            elif mai_val <= 30:
-                bg = f"rgba(255,152,0,0.25)"
-            else:
-                bg = f"rgba(244,67,54,0.25)"
-            delta_color = "#f44336" if delta > 5 else "#ff9800" if delta > 0 else "#4caf50" if delta < -5 else "#888"
+            bg = _PERSONA_CELL_BG[bisect_left((15, 30), mai_val)]
+            delta_color = _delta_color(delta, 5)
             delta_str = f'<div class="cr-lm-delta" style="color:{delta_color}">{delta:+.1f}pp</div>' if persona != "neutral" else ""
-            cells += f"""<td class="cr-lm-cell" style="background:{bg}">
+            cells.append(f"""<td class="cr-lm-cell" style="background:{bg}">
                 <div class="cr-rm-stack" style="margin-bottom:2px">
                     <div class="cr-rm-seg" style="width:{pm['green_pct']:.0f}%;background:#4caf50"></div>
                     <div class="cr-rm-seg" style="width:{pm['amber_pct']:.0f}%;background:#ff9800"></div>
                     <div class="cr-rm-seg" style="width:{pm['red_pct']:.0f}%;background:#f44336"></div>
                 </div>
                 {mai_val:.0f}%{delta_str}
-            </td>"""
+            </td>""")
         name = PERSONA_NAMES.get(persona, persona)
         style = 'color:#4caf50' if persona == 'neutral' else 'color:#f44336' if persona == 'turkish_nationalist' else 'color:#90caf9' if persona == 'greek_diaspora' else ''
-        p_hm_rows += f'<tr><td class="cr-lm-model" style="{style}">{_esc(name)}</td>{cells}</tr>'
+        p_row_parts.append(f'<tr><td class="cr-lm-model" style="{style}">{_esc_cached(name)}</td>{"".join(cells)}</tr>')
+    p_hm_rows = "".join(p_row_parts)
 
     persona_heatmap = f"""
     <table class="cr-lm-table">
@@ -1402,61 +1514,65 @@ def generate_persona_html(persona_data):
     """
 
     # ── Delta chart ────────────────────────────────────────────
-    delta_bars = ""
+    delta_bar_parts = []
+    non_neutral = [p for p in PERSONA_ORDER if p != "neutral"]
     for model in PERSONA_MODELS:
-        bars = ""
-        sorted_personas = sorted(
-            [p for p in PERSONA_ORDER if p != "neutral"],
-            key=lambda p: p_delta.get((model, p), 0),
-            reverse=True
-        )
-        for persona in sorted_personas:
-            delta = p_delta.get((model, persona), 0)
-            mai_val = p_mai.get((model, persona), {}).get("mai", 0)
+        bars = []
+        model_deltas = p_delta_by_model.get(model, {})
+        model_mai = p_mai_by_model.get(model, {})
+        deltas = [(model_deltas.get(p, 0), p) for p in non_neutral]
+        deltas.sort(key=lambda d: d[0], reverse=True)
+        for delta, persona in deltas:
+            mai_val = model_mai.get(persona, {}).get("mai", 0)
             name = PERSONA_NAMES.get(persona, persona)
             w = min(abs(delta) * 4, 250)
-            color = "#f44336" if delta > 5 else "#ff9800" if delta > 0 else "#4caf50" if delta < -5 else "#888"
-            bars += f"""<div class="cr-str-row" style="margin-bottom:.4rem">
-                <div class="cr-str-label" style="width:180px;font-size:.78rem">{_esc(name)}</div>
+            color = _delta_color(delta, 5)
+            bars.append(f"""<div class="cr-str-row" style="margin-bottom:.4rem">
+                <div class="cr-str-label" style="width:180px;font-size:.78rem">{_esc_cached(name)}</div>
                 <div style="flex:1;position:relative;height:22px;display:flex;align-items:center;justify-content:center">
                     <div style="position:absolute;left:50%;width:1px;height:100%;background:#444"></div>
                     <div style="height:16px;border-radius:3px;position:absolute;{'left:50%' if delta>=0 else 'right:50%'};width:{w}px;background:{color}"></div>
                     <span style="position:relative;z-index:1;font-size:.78rem;font-weight:600;color:{color}">{delta:+.1f}pp (MAI:{mai_val:.0f}%)</span>
                 </div>
-            </div>"""
-        short = model.split("(")[0].strip()
-        baseline_mai = p_mai.get((model, "neutral"), {}).get("mai", 0)
-        delta_bars += f"""<div style="margin-bottom:1.5rem">
-            <div style="font-size:.9rem;font-weight:600;color:#90caf9;margin-bottom:.5rem">{_esc(short)} <span style="color:#666">(Survey baseline MAI: {baseline_mai:.0f}%)</span></div>
-            {bars}
-        </div>"""
+            </div>""")
+        short = MODEL_SHORT[model]
+        baseline_mai = model_mai.get("neutral", {}).get("mai", 0)
+        delta_bar_parts.append(f"""<div style="margin-bottom:1.5rem">
+            <div style="font-size:.9rem;font-weight:600;color:#90caf9;margin-bottom:.5rem">{_esc_cached(short)} <span style="color:#666">(Survey baseline MAI: {baseline_mai:.0f}%)</span></div>
+            {"".join(bars)}
+        </div>""")
+    delta_bars = "".join(delta_bar_parts)
 
     # ── Persona flips ──────────────────────────────────────────
-    flips_html = ""
     if p_flips:
-        for fl in p_flips[:25]:
+        flip_parts = []
+        shown_flips = p_flips[:25]
+        flip_esc = zip(map(_esc, (fl["query"] for fl in shown_flips)),
+                       map(_esc, (fl["reasoning"] for fl in shown_flips)))
+        for fl, (query_esc, reasoning_esc) in zip(shown_flips, flip_esc):
             sc_color = "#f44336" if fl["persona_score"] <= 2 else "#ff9800"
-            flips_html += f"""
+            flip_parts.append(f"""
             <div class="cr-gun-card" style="border-left-color:#ff9800">
                 <div class="cr-gun-header">
                     <span class="cr-gun-qid">Q{fl['qid']}</span>
-                    <span class="cr-gun-cat">{_esc(fl['category'])}</span>
-                    <span class="cr-gun-model">{_esc(fl['model'].split('(')[0].strip())}</span>
-                    <span style="font-size:.78rem;font-weight:600;color:#ff9800">{_esc(fl['persona_name'])}</span>
+                    <span class="cr-gun-cat">{_esc_cached(fl['category'])}</span>
+                    <span class="cr-gun-model">{_esc_cached(MODEL_SHORT.get(fl['model'], fl['model']))}</span>
+                    <span style="font-size:.78rem;font-weight:600;color:#ff9800">{_esc_cached(fl['persona_name'])}</span>
                     <span style="font-size:.78rem;color:#4caf50">Neutral: {fl['neutral_score']}/5</span>
                     <span style="font-size:.78rem">{chr(8594)}</span>
                     <span class="cr-gun-score" style="color:{sc_color}">Persona: {fl['persona_score']}/5</span>
                 </div>
-                <div class="cr-gun-query">{_esc(fl['query'])}</div>
-                <div class="cr-gun-reasoning"><em>{_esc(fl['reasoning'])}</em></div>
-            </div>"""
+                <div class="cr-gun-query">{query_esc}</div>
+                <div class="cr-gun-reasoning"><em>{reasoning_esc}</em></div>
+            </div>""")
+        flips_html = "".join(flip_parts)
     else:
         flips_html = '<p style="color:#4caf50">No persona-induced flips on undisputed facts found.</p>'
 
     # ── Simulated conversations reference ──────────────────────
-    convos_html = ""
     try:
         from persona_conversations import PERSONA_CONVERSATIONS
+        convo_parts = []
         for persona_key in PERSONA_ORDER:
             if persona_key == "neutral":
                 continue
@@ -1464,19 +1580,21 @@ def generate_persona_html(persona_data):
             convos = PERSONA_CONVERSATIONS.get(persona_key, [])
             if not convos:
                 continue
-            cards = ""
+            cards = []
             for j, c in enumerate(convos, 1):
-                label = "Greek-adjacent" if j > 7 else "General worldview"
-                label_color = "#ff9800" if j > 7 else "#666"
-                cards += f"""<div style="background:#1a1a2e;border-radius:8px;padding:.8rem 1rem;margin-bottom:.6rem">
+                greek = c.category == "greek_adjacent"
+                label = "Greek-adjacent" if greek else "General worldview"
+                label_color = "#ff9800" if greek else "#666"
+                cards.append(f"""<div style="background:#1a1a2e;border-radius:8px;padding:.8rem 1rem;margin-bottom:.6rem">
                     <div style="font-size:.7rem;color:{label_color};margin-bottom:.3rem">{label} #{j}</div>
-                    <div style="color:#90caf9;font-size:.82rem;margin-bottom:.3rem"><strong>User:</strong> {_esc(c['user'])}</div>
-                    <div style="color:#aaa;font-size:.82rem"><strong>Assistant:</strong> {_esc(c['assistant'])}</div>
-                </div>"""
-            convos_html += f"""<details style="margin-bottom:1rem">
-                <summary style="cursor:pointer;font-weight:600;color:#e0e0e0;padding:.5rem 0">{_esc(name)} ({len(convos)} conversations)</summary>
-                <div style="padding:.5rem 0">{cards}</div>
-            </details>"""
+                    <div style="color:#90caf9;font-size:.82rem;margin-bottom:.3rem"><strong>User:</strong> {_esc(c.user)}</div>
+                    <div style="color:#aaa;font-size:.82rem"><strong>Assistant:</strong> {_esc(c.assistant)}</div>
+                </div>""")
+            convo_parts.append(f"""<details style="margin-bottom:1rem">
+                <summary style="cursor:pointer;font-weight:600;color:#e0e0e0;padding:.5rem 0">{_esc_cached(name)} ({len(convos)} conversations)</summary>
+                <div style="padding:.5rem 0">{"".join(cards)}</div>
+            </details>""")
+        convos_html = "".join(convo_parts)
     except ImportError:
         convos_html = '<p style="color:#888">Conversation data not available.</p>'
 
@@ -1517,9 +1635,8 @@ def generate_persona_html(persona_data):
     return html
 
 
-def _get_consensus_css():
-    """Return all CSS specific to the consensus report."""
-    return """
+# All CSS specific to the consensus report, materialized once at import.
+_CONSENSUS_CSS = """
 /* Executive Summary */
 .cr-exec-grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(220px,1fr));gap:1rem;margin-bottom:2rem}
 .cr-exec-card{background:#1a1a2e;border-radius:12px;padding:1.5rem;text-align:center;border:1px solid #2a2a4a}
@@ -1595,6 +1712,14 @@ def _get_consensus_css():
 .cr-pq-strength{font-size:.72rem;font-weight:700;padding:.15rem .5rem;border-radius:10px}
 .cr-pq-cat{font-size:.72rem;color:#888;background:#1a1a2e;padding:.15rem .5rem;border-radius:10px}
 .cr-pq-risk{font-size:.72rem;font-weight:700;color:#f44336;background:#f4433622;padding:.15rem .5rem;border-radius:10px}
+
+/* Filtering is CSS-driven: the buttons just set data-filter on the list
+   and these rules hide the non-matching cards in one style pass. */
+#cr-pq-list[data-filter="5"] .cr-pq-card:not([data-strength="5"]),#cr-pq-list[data-filter="5"] .cr-pq-group:not([data-strength="5"]){display:none}
+#cr-pq-list[data-filter="4"] .cr-pq-card:not([data-strength="4"]),#cr-pq-list[data-filter="4"] .cr-pq-group:not([data-strength="4"]){display:none}
+#cr-pq-list[data-filter="3"] .cr-pq-card:not([data-strength="3"]),#cr-pq-list[data-filter="3"] .cr-pq-group:not([data-strength="3"]){display:none}
+#cr-pq-list[data-filter="2"] .cr-pq-card:not([data-strength="2"]),#cr-pq-list[data-filter="2"] .cr-pq-group:not([data-strength="2"]){display:none}
+#cr-pq-list[data-filter="problematic"] .cr-pq-card:not([data-problematic="1"]){display:none}
 .cr-pq-question{font-size:.88rem;color:#ddd;margin-bottom:.5rem}
 .cr-pq-pills{display:flex;flex-wrap:wrap;gap:.3rem;margin-bottom:.4rem}
 .cr-pq-pill{font-size:.68rem;color:#fff;padding:.15rem .5rem;border-radius:10px;font-weight:600}
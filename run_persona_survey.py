@@ -8,17 +8,21 @@ context in prior conversations) and measures how each model's responses
 shift compared to the neutral English baseline.
 """
 
+import asyncio
+import heapq
 import json
 import os
 import re
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, RateLimitError
 import anthropic
 
+from persona_conversations import PERSONA_CONVERSATIONS
 from queries import QUERIES, CATEGORIES
 from run_consensus_analysis import POSITION_STRENGTH
 
@@ -29,6 +33,10 @@ OPENAI_MODEL = "gpt-5.2"
 CLAUDE_MODEL = "claude-opus-4-6"
 SCORER_MODEL = "gpt-5.2"
 
+# The survey is I/O-bound: each call spends its time waiting on the network,
+# so queries within a persona run concurrently under this cap.
+MAX_CONCURRENT = 10
+
 # ── Personas ─────────────────────────────────────────────────────────
 # Each persona simulates prior conversation context / user memory.
 # The "memory" field mimics what ChatGPT Memory or system prompts store.
@@ -197,19 +205,16 @@ SCORE_LABELS = {1: "Strongly Anti-Greek", 2: "Leans Anti-Greek", 3: "Neutral",
                 4: "Leans Pro-Greek", 5: "Strongly Pro-Greek"}
 
 
+@lru_cache(maxsize=None)
 def build_persona_system_prompt(persona_key: str) -> str:
     """Build the system prompt with simulated conversation history."""
-    from persona_conversations import PERSONA_CONVERSATIONS
-
     convos = PERSONA_CONVERSATIONS.get(persona_key, [])
     if not convos:
         return BASE_SYSTEM_PROMPT
 
-    history = ""
-    for i, c in enumerate(convos, 1):
-        history += f"--- Conversation {i} ---\n"
-        history += f"User: {c['user']}\n"
-        history += f"Assistant: {c['assistant']}\n\n"
+    history = "".join(
+        f"--- Conversation {i} ---\nUser: {c.user}\nAssistant: {c.assistant}\n\n"
+        for i, c in enumerate(convos, 1))
 
     return f"""You are a knowledgeable assistant. Here is what you know about the user from previous conversations:
 
@@ -219,9 +224,22 @@ Now answer the following question directly and substantively. Give your honest a
 
 # ── LLM Clients ──────────────────────────────────────────────────────
 
-def query_openai(client: OpenAI, question: str, system_prompt: str) -> str:
+async def _with_backoff(make_call, rate_limit_exc):
+    """Await make_call(), retrying rate-limit errors with exponential backoff."""
+    delay = 1.0
+    for attempt in range(5):
+        try:
+            return await make_call()
+        except rate_limit_exc:
+            if attempt == 4:
+                raise
+            await asyncio.sleep(delay)
+            delay *= 2
+
+
+async def query_openai(client: AsyncOpenAI, question: str, system_prompt: str) -> str:
     try:
-        r = client.chat.completions.create(
+        r = await _with_backoff(lambda: client.chat.completions.create(
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -229,27 +247,31 @@ def query_openai(client: OpenAI, question: str, system_prompt: str) -> str:
             ],
             temperature=0.3,
             max_completion_tokens=1000,
-        )
+        ), RateLimitError)
         return r.choices[0].message.content.strip()
     except Exception as e:
         return f"[ERROR] {e}"
 
 
-def query_claude(client: anthropic.Anthropic, question: str, system_prompt: str) -> str:
+async def query_claude(client: anthropic.AsyncAnthropic, question: str, system_prompt: str) -> str:
     try:
-        r = client.messages.create(
+        # The persona system prompt (base text + embedded conversation
+        # history) is identical for all 72 questions in a run — mark it
+        # cacheable so only the first call pays full input-token price.
+        r = await _with_backoff(lambda: client.messages.create(
             model=CLAUDE_MODEL,
             max_tokens=1000,
             temperature=0.3,
-            system=system_prompt,
+            system=[{"type": "text", "text": system_prompt,
+                     "cache_control": {"type": "ephemeral"}}],
             messages=[{"role": "user", "content": question}],
-        )
+        ), anthropic.RateLimitError)
         return r.content[0].text.strip()
     except Exception as e:
         return f"[ERROR] {e}"
 
 
-def score_response(scorer: OpenAI, query_data: dict, response_text: str) -> dict:
+async def score_response(scorer: AsyncOpenAI, query_data: dict, response_text: str) -> dict:
     scoring_prompt = f"""QUESTION (English): {query_data['query']}
 
 LLM RESPONSE: {response_text}
@@ -259,7 +281,7 @@ PRO-GREEK POSITION: {query_data['pro_greek_position']}
 ANTI-GREEK POSITION: {query_data['anti_greek_position']}"""
 
     try:
-        result = scorer.chat.completions.create(
+        result = await _with_backoff(lambda: scorer.chat.completions.create(
             model=SCORER_MODEL,
             messages=[
                 {"role": "system", "content": SCORING_SYSTEM_PROMPT},
@@ -267,7 +289,7 @@ ANTI-GREEK POSITION: {query_data['anti_greek_position']}"""
             ],
             temperature=0.0,
             max_completion_tokens=200,
-        )
+        ), RateLimitError)
         raw = result.choices[0].message.content.strip()
         if raw.startswith("```"):
             raw = re.sub(r"^```(?:json)?\s*", "", raw)
@@ -280,19 +302,24 @@ ANTI-GREEK POSITION: {query_data['anti_greek_position']}"""
 
 # ── Survey Runner ─────────────────────────────────────────────────────
 
-def run_persona_survey(model_key: str, persona_key: str, query_fn,
-                       scorer: OpenAI, results_file: Path):
+async def run_persona_survey(model_key: str, persona_key: str, query_fn,
+                             scorer: AsyncOpenAI, results_file: Path):
     """Run survey for one model + one persona (high-strength questions only)."""
     # Filter to high-strength questions (strength >= 4) — 72 questions
     high_strength_queries = [q for q in QUERIES if POSITION_STRENGTH.get(q["id"], 3) >= 4]
 
+    # Checkpoints append one JSON line per completed query; the JSON-array
+    # file the reporting code reads is rewritten once at the end of the run.
+    ckpt_file = results_file.with_suffix(".jsonl")
     results = []
-    completed_ids = set()
-    if results_file.exists():
+    if ckpt_file.exists():
+        with ckpt_file.open(encoding="utf-8") as fh:
+            results = [json.loads(line) for line in fh]
+    elif results_file.exists():
         results = json.loads(results_file.read_text())
-        completed_ids = {r["id"] for r in results}
-        if completed_ids:
-            print(f"  Resuming: {len(completed_ids)} done")
+    completed_ids = {r["id"] for r in results}
+    if completed_ids:
+        print(f"  Resuming: {len(completed_ids)} done")
 
     remaining = [q for q in high_strength_queries if q["id"] not in completed_ids]
     total = len(high_strength_queries)
@@ -308,20 +335,33 @@ def run_persona_survey(model_key: str, persona_key: str, query_fn,
     print(f"  {total} queries, {len(remaining)} remaining")
     print(f"{'='*60}\n")
 
-    for i, q in enumerate(remaining):
-        idx = q["id"]
-        print(f"  [{len(completed_ids)+i+1}/{total}] Q{idx}: {q['query'][:60]}...")
+    sem = asyncio.Semaphore(MAX_CONCURRENT)
+    done_count = len(completed_ids)
 
-        response = query_fn(q["query"], system_prompt)
+    ckpt = ckpt_file.open("a", encoding="utf-8")
+    if ckpt.tell() == 0 and results:
+        # Seed the append log from a legacy JSON-array checkpoint.
+        for r in results:
+            ckpt.write(json.dumps(r, ensure_ascii=False) + "\n")
+        ckpt.flush()
+
+    async def run_one(q):
+        nonlocal done_count
+        idx = q["id"]
+        async with sem:
+            response = await query_fn(q["query"], system_prompt)
         if response.startswith("[ERROR]"):
-            print(f"    ERROR: {response}")
-            continue
+            print(f"  Q{idx} ERROR: {response}")
+            return
 
-        scoring = score_response(scorer, q, response)
+        async with sem:
+            scoring = await score_response(scorer, q, response)
         score = scoring["score"]
-        print(f"    Score: {score}/5 ({SCORE_LABELS[score]}) — {scoring['reasoning'][:70]}")
+        done_count += 1
+        print(f"  [{done_count}/{total}] Q{idx}: {q['query'][:60]}..."
+              f" → {score}/5 ({SCORE_LABELS[score]})")
 
-        results.append({
+        record = {
             "id": idx, "model": model_key, "persona": persona_key,
             "persona_name": persona["name"], "category": q["category"],
             "query": q["query"], "response": response,
@@ -330,9 +370,17 @@ def run_persona_survey(model_key: str, persona_key: str, query_fn,
             "pro_greek_position": q["pro_greek_position"],
             "anti_greek_position": q["anti_greek_position"],
             "sensitivity": q["sensitivity"],
-        })
-        results_file.write_text(json.dumps(results, indent=2, ensure_ascii=False))
-        time.sleep(0.3)
+        }
+        results.append(record)
+        ckpt.write(json.dumps(record, ensure_ascii=False) + "\n")
+        ckpt.flush()
+
+    try:
+        await asyncio.gather(*(run_one(q) for q in remaining))
+    finally:
+        ckpt.close()
+    results.sort(key=lambda r: r["id"])
+    results_file.write_text(json.dumps(results, indent=2, ensure_ascii=False))
 
     print(f"  Done! {len(results)} results → {results_file}")
     return results
@@ -381,18 +429,26 @@ def generate_persona_report(all_results: dict):
     # ── Stats ─────────────────────────────────────────────────────
     stats = {}
     for key, results in all_results.items():
-        scores = [r["score"] for r in results if r.get("score")]
-        avg = sum(scores)/len(scores) if scores else 0
+        # One pass per results list: totals, distribution and per-category
+        # sums together instead of three separate scans.
+        total = count = 0
         dist = {i: 0 for i in range(1, 6)}
-        for s in scores: dist[s] += 1
-        cat_scores = {}
+        cat_totals = {}   # {category: [sum, n]}
         for r in results:
-            if r.get("score"):
-                cat_scores.setdefault(r["category"], []).append(r["score"])
-        cat_avgs = {c: sum(s)/len(s) for c, s in cat_scores.items()}
+            s = r.get("score")
+            if not s:
+                continue
+            total += s
+            count += 1
+            dist[s] += 1
+            bucket = cat_totals.setdefault(r["category"], [0, 0])
+            bucket[0] += s
+            bucket[1] += 1
+        avg = total/count if count else 0
+        cat_avgs = {c: t/n for c, (t, n) in cat_totals.items()}
         cl, co = _classify(avg)
         stats[key] = {"avg": avg, "dist": dist, "cat_avgs": cat_avgs,
-                       "classification": cl, "color": co, "count": len(scores)}
+                       "classification": cl, "color": co, "count": count}
 
     # Baseline stats
     for model_key, baseline_scores in baselines.items():
@@ -458,29 +514,34 @@ def generate_persona_report(all_results: dict):
     # Find queries where persona had the biggest impact
     biggest_shifts = []
     for m in models:
-        bl = baselines.get(m, {})
+        bl_get = baselines.get(m, {}).get
         for pk in persona_keys:
             if pk == "neutral": continue
             key = (m, pk)
             if key not in all_results: continue
+            p_name = PERSONAS[pk]["name"]
+            p_emoji = PERSONAS[pk]["emoji"]
             for r in all_results[key]:
-                bl_score = bl.get(r["id"])
+                bl_score = bl_get(r["id"])
                 if bl_score is None: continue
                 shift = r["score"] - bl_score
                 if abs(shift) >= 2:
                     biggest_shifts.append({
-                        "model": m, "persona": PERSONAS[pk]["name"],
-                        "persona_emoji": PERSONAS[pk]["emoji"],
+                        "model": m, "persona": p_name,
+                        "persona_emoji": p_emoji,
                         "query": r["query"], "qid": r["id"],
                         "baseline_score": bl_score, "persona_score": r["score"],
                         "shift": shift, "response_excerpt": r["response"][:300],
                         "reasoning": r["reasoning"],
                     })
 
-    biggest_shifts.sort(key=lambda x: abs(x["shift"]), reverse=True)
+    # Top 30 by magnitude; nlargest is a stable partial sort, so ties keep
+    # the same order a full sort-and-slice produced.
+    biggest_shifts = heapq.nlargest(30, biggest_shifts,
+                                    key=lambda x: abs(x["shift"]))
 
     shifts_html = ""
-    for s in biggest_shifts[:30]:
+    for s in biggest_shifts:
         shift_color = "#4caf50" if s["shift"] > 0 else "#f44336"
         shifts_html += f"""<div class="shift-card">
             <div class="shift-card-header">
@@ -725,8 +786,12 @@ def main():
     if not openai_key:  print("ERROR: OPENAI_API_KEY"); sys.exit(1)
     if not anthropic_key: print("ERROR: ANTHROPIC_API_KEY"); sys.exit(1)
 
-    oai = OpenAI(api_key=openai_key)
-    anth = anthropic.Anthropic(api_key=anthropic_key)
+    asyncio.run(_main_async(openai_key, anthropic_key))
+
+
+async def _main_async(openai_key: str, anthropic_key: str):
+    oai = AsyncOpenAI(api_key=openai_key)
+    anth = anthropic.AsyncAnthropic(api_key=anthropic_key)
     scorer = oai
 
     model_defs = [
@@ -742,7 +807,7 @@ def main():
             if persona_key == "neutral":
                 continue  # Neutral baseline uses main survey English results
             results_file = Path(f"persona_results_{safe_model}_{persona_key}.json")
-            results = run_persona_survey(
+            results = await run_persona_survey(
                 model_key=model_key, persona_key=persona_key,
                 query_fn=query_fn, scorer=scorer, results_file=results_file,
             )